@@ -1,91 +1,187 @@
 """
 Configuration settings for the SOC Agent Automation application.
 """
+import functools
 import os
-from typing import Dict, Any, Optional
+import sys
+import types
+from typing import Dict, Any, Optional, Mapping
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file. Guarded so re-imports under
+# Streamlit's script-rerun model never re-parse the file.
+if not os.environ.get('_DOTENV_LOADED'):
+    load_dotenv()
+    os.environ['_DOTENV_LOADED'] = '1'
+
+# Snapshot the environment once at import time. os.getenv goes through the
+# os.environ codec machinery on every access, so config reads use this plain
+# dict instead of hitting os.environ repeatedly.
+_ENV = dict(os.environ)
+_FLASK_ENV = _ENV.get('FLASK_ENV', 'development')
+
+@functools.lru_cache(maxsize=None)
+def _int(name: str, default: str) -> int:
+    """Read an integer setting from the environment snapshot (cached)"""
+    return int(_ENV.get(name, default))
+
+
+# Project root computed once at import so command resolution avoids
+# repeated os.path work on every config build.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve_command_path(cmd: Optional[str]) -> Optional[str]:
+    """Resolve a relative MCP command against the project root (cached)"""
+    if not cmd:
+        return cmd
+
+    first_token = cmd.split(' ', 1)[0]
+    if os.path.isabs(first_token):
+        return cmd
+
+    candidate = os.path.join(_PROJECT_ROOT, first_token)
+    if os.path.exists(candidate):
+        return cmd.replace(first_token, candidate, 1)
+    return cmd
 
 class Config:
     """Main configuration class"""
-    
+
     # Database settings
-    DATABASE_FILE = os.getenv("DATABASE_FILE", "chat_logs.db")
-    
+    DATABASE_FILE = _ENV.get("DATABASE_FILE", "chat_logs.db")
+    # WAL mode + relaxed fsync pragmas; set SQLITE_TUNING=false to opt out
+    SQLITE_TUNING = _ENV.get("SQLITE_TUNING", "true").lower() == "true"
+
     # Groq LLM settings
-    GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-    GROQ_MODEL = os.getenv("GROQ_MODEL", "mixtral-8x7b-32768")
-    
-    # MCP settings  
-    MCP_COMMAND = os.getenv("MCP_COMMAND")
-    
+    GROQ_API_KEY = _ENV.get("GROQ_API_KEY")
+    GROQ_MODEL = _ENV.get("GROQ_MODEL", "mixtral-8x7b-32768")
+
+    # MCP settings
+    MCP_COMMAND = _ENV.get("MCP_COMMAND")
+
     # Wazuh API settings
-    WAZUH_API_HOST = os.getenv("WAZUH_API_HOST", "127.0.0.1")
-    WAZUH_API_PORT = os.getenv("WAZUH_API_PORT", "55000")
-    WAZUH_API_USERNAME = os.getenv("WAZUH_API_USERNAME", "admin")
-    WAZUH_API_PASSWORD = os.getenv("WAZUH_API_PASSWORD")
-    
+    WAZUH_API_HOST = _ENV.get("WAZUH_API_HOST", "127.0.0.1")
+    WAZUH_API_PORT = _ENV.get("WAZUH_API_PORT", "55000")
+    WAZUH_API_USERNAME = _ENV.get("WAZUH_API_USERNAME", "admin")
+    WAZUH_API_PASSWORD = _ENV.get("WAZUH_API_PASSWORD")
+
     # Wazuh Indexer settings
-    WAZUH_INDEXER_HOST = os.getenv("WAZUH_INDEXER_HOST", "127.0.0.1")
-    WAZUH_INDEXER_PORT = os.getenv("WAZUH_INDEXER_PORT", "9200")
-    WAZUH_INDEXER_USERNAME = os.getenv("WAZUH_INDEXER_USERNAME", "admin")
-    WAZUH_INDEXER_PASSWORD = os.getenv("WAZUH_INDEXER_PASSWORD")
-    
+    WAZUH_INDEXER_HOST = _ENV.get("WAZUH_INDEXER_HOST", "127.0.0.1")
+    WAZUH_INDEXER_PORT = _ENV.get("WAZUH_INDEXER_PORT", "9200")
+    WAZUH_INDEXER_USERNAME = _ENV.get("WAZUH_INDEXER_USERNAME", "admin")
+    WAZUH_INDEXER_PASSWORD = _ENV.get("WAZUH_INDEXER_PASSWORD")
+
     # SSL and protocol settings
-    WAZUH_VERIFY_SSL = os.getenv("WAZUH_VERIFY_SSL", "false")
-    WAZUH_TEST_PROTOCOL = os.getenv("WAZUH_TEST_PROTOCOL", "http")
-    
+    WAZUH_VERIFY_SSL = _ENV.get("WAZUH_VERIFY_SSL", "false")
+    # Coerced once here so callers never re-run the string comparison
+    WAZUH_VERIFY_SSL_BOOL = WAZUH_VERIFY_SSL.lower() == "true"
+    WAZUH_TEST_PROTOCOL = _ENV.get("WAZUH_TEST_PROTOCOL", "http")
+
     # Logging
-    RUST_LOG = os.getenv("RUST_LOG", "info")
-    
+    RUST_LOG = _ENV.get("RUST_LOG", "info")
+
     # Agent settings
-    MAX_AGENT_STEPS = int(os.getenv("MAX_AGENT_STEPS", "10"))
-    DEFAULT_PROACTIVE_INTERVAL = int(os.getenv("DEFAULT_PROACTIVE_INTERVAL", "60"))
+    MAX_AGENT_STEPS = _int("MAX_AGENT_STEPS", "10")
+    DEFAULT_PROACTIVE_INTERVAL = _int("DEFAULT_PROACTIVE_INTERVAL", "60")
+
+    # Agent response cache TTL in seconds; 0 disables caching
+    AGENT_CACHE_TTL = _int("AGENT_CACHE_TTL", "300")
+
+    # Maximum concurrent agent runs across all sessions
+    MAX_CONCURRENCY = _int("MAX_CONCURRENCY", "8")
+
+    @classmethod
+    def refresh_env(cls) -> None:
+        """Re-snapshot os.environ and reload configuration values"""
+        global _ENV, _FLASK_ENV
+        _ENV = dict(os.environ)
+        _FLASK_ENV = _ENV.get('FLASK_ENV', 'development')
+        _int.cache_clear()
+
+        Config.DATABASE_FILE = _ENV.get("DATABASE_FILE", "chat_logs.db")
+        Config.SQLITE_TUNING = _ENV.get("SQLITE_TUNING", "true").lower() == "true"
+        Config.GROQ_API_KEY = _ENV.get("GROQ_API_KEY")
+        Config.GROQ_MODEL = _ENV.get("GROQ_MODEL", "mixtral-8x7b-32768")
+        Config.MCP_COMMAND = _ENV.get("MCP_COMMAND")
+        Config.WAZUH_API_HOST = _ENV.get("WAZUH_API_HOST", "127.0.0.1")
+        Config.WAZUH_API_PORT = _ENV.get("WAZUH_API_PORT", "55000")
+        Config.WAZUH_API_USERNAME = _ENV.get("WAZUH_API_USERNAME", "admin")
+        Config.WAZUH_API_PASSWORD = _ENV.get("WAZUH_API_PASSWORD")
+        Config.WAZUH_INDEXER_HOST = _ENV.get("WAZUH_INDEXER_HOST", "127.0.0.1")
+        Config.WAZUH_INDEXER_PORT = _ENV.get("WAZUH_INDEXER_PORT", "9200")
+        Config.WAZUH_INDEXER_USERNAME = _ENV.get("WAZUH_INDEXER_USERNAME", "admin")
+        Config.WAZUH_INDEXER_PASSWORD = _ENV.get("WAZUH_INDEXER_PASSWORD")
+        Config.WAZUH_VERIFY_SSL = _ENV.get("WAZUH_VERIFY_SSL", "false")
+        Config.WAZUH_VERIFY_SSL_BOOL = Config.WAZUH_VERIFY_SSL.lower() == "true"
+        Config.WAZUH_TEST_PROTOCOL = _ENV.get("WAZUH_TEST_PROTOCOL", "http")
+        Config.RUST_LOG = _ENV.get("RUST_LOG", "info")
+        Config.MAX_AGENT_STEPS = _int("MAX_AGENT_STEPS", "10")
+        Config.DEFAULT_PROACTIVE_INTERVAL = _int("DEFAULT_PROACTIVE_INTERVAL", "60")
+        Config.AGENT_CACHE_TTL = _int("AGENT_CACHE_TTL", "300")
+        Config.MAX_CONCURRENCY = _int("MAX_CONCURRENCY", "8")
+
+        # Invalidate cached derived state so it is rebuilt from the new values
+        Config._validated = False
+        _build_mcp_config.cache_clear()
     
     @classmethod
-    def get_mcp_config(cls) -> Dict[str, Any]:
-        """Get MCP server configuration"""
-        return {
-            "mcpServers": {
-                "wazuh": {
-                    "command": cls.MCP_COMMAND,
-                    "args": [],
-                    "env": {
-                        "WAZUH_API_HOST": cls.WAZUH_API_HOST,
-                        "WAZUH_API_PORT": cls.WAZUH_API_PORT,
-                        "WAZUH_API_USERNAME": cls.WAZUH_API_USERNAME,
-                        "WAZUH_API_PASSWORD": cls.WAZUH_API_PASSWORD,
-                        "WAZUH_INDEXER_HOST": cls.WAZUH_INDEXER_HOST,
-                        "WAZUH_INDEXER_PORT": cls.WAZUH_INDEXER_PORT,
-                        "WAZUH_INDEXER_USERNAME": cls.WAZUH_INDEXER_USERNAME,
-                        "WAZUH_INDEXER_PASSWORD": cls.WAZUH_INDEXER_PASSWORD,
-                        "WAZUH_VERIFY_SSL": cls.WAZUH_VERIFY_SSL,
-                        "WAZUH_TEST_PROTOCOL": cls.WAZUH_TEST_PROTOCOL,
-                        "RUST_LOG": cls.RUST_LOG
-                    }
-                }
-            }
-        }
+    def get_mcp_config(cls) -> Mapping[str, Any]:
+        """Get MCP server configuration (cached, read-only mapping)"""
+        return _build_mcp_config()
     
+    # Set once validation passes so reruns skip the check; reset by refresh_env()
+    _validated = False
+
     @classmethod
     def validate_config(cls) -> bool:
         """Validate required configuration"""
-        required_vars = [
-            cls.GROQ_API_KEY,
-            cls.MCP_COMMAND,
-            cls.WAZUH_API_PASSWORD,
-            cls.WAZUH_INDEXER_PASSWORD
-        ]
-        
-        missing = [var for var in required_vars if not var]
+        if cls._validated:
+            return True
+
+        required_vars = (
+            ("GROQ_API_KEY", cls.GROQ_API_KEY),
+            ("MCP_COMMAND", cls.MCP_COMMAND),
+            ("WAZUH_API_PASSWORD", cls.WAZUH_API_PASSWORD),
+            ("WAZUH_INDEXER_PASSWORD", cls.WAZUH_INDEXER_PASSWORD)
+        )
+
+        missing = [name for name, value in required_vars if not value]
         if missing:
             raise ValueError(f"Missing required configuration variables: {missing}")
-        
+
+        cls._validated = True
         return True
 
 
+@functools.lru_cache(maxsize=1)
+def _build_mcp_config() -> Mapping[str, Any]:
+    """Build the MCP server configuration once and reuse it across calls"""
+    env = types.MappingProxyType({
+        "WAZUH_API_HOST": Config.WAZUH_API_HOST,
+        "WAZUH_API_PORT": Config.WAZUH_API_PORT,
+        "WAZUH_API_USERNAME": Config.WAZUH_API_USERNAME,
+        "WAZUH_API_PASSWORD": Config.WAZUH_API_PASSWORD,
+        "WAZUH_INDEXER_HOST": Config.WAZUH_INDEXER_HOST,
+        "WAZUH_INDEXER_PORT": Config.WAZUH_INDEXER_PORT,
+        "WAZUH_INDEXER_USERNAME": Config.WAZUH_INDEXER_USERNAME,
+        "WAZUH_INDEXER_PASSWORD": Config.WAZUH_INDEXER_PASSWORD,
+        "WAZUH_VERIFY_SSL": Config.WAZUH_VERIFY_SSL,
+        "WAZUH_TEST_PROTOCOL": Config.WAZUH_TEST_PROTOCOL,
+        "RUST_LOG": Config.RUST_LOG
+    })
+    return types.MappingProxyType({
+        "mcpServers": types.MappingProxyType({
+            "wazuh": types.MappingProxyType({
+                "command": _resolve_command_path(Config.MCP_COMMAND),
+                "args": [],
+                "env": env
+            })
+        })
+    })
+
+
 class DevelopmentConfig(Config):
     """Development configuration"""
     DEBUG = True
@@ -102,6 +198,26 @@ class TestConfig(Config):
     DATABASE_FILE = ":memory:"  # Use in-memory database for tests
 
 
+def compile_config() -> types.ModuleType:
+    """Compile current Config values into a flat module of constants.
+
+    A module-level name lookup is cheaper than the Config.<ATTR> attribute
+    chain, so hot paths (proactive agent loops, per-message handlers) can
+    bind values directly via ``import _compiled_config``. Call again after
+    refresh_env() to re-emit the module with updated values.
+    """
+    captured = {
+        name: value
+        for name, value in vars(Config).items()
+        if name.isupper()
+    }
+    code = "\n".join(f"{name} = {value!r}" for name, value in captured.items())
+    module = types.ModuleType("_compiled_config")
+    exec(code, module.__dict__)
+    sys.modules["_compiled_config"] = module
+    return module
+
+
 # Configuration mapping
 config_map = {
     'development': DevelopmentConfig,
@@ -110,7 +226,12 @@ config_map = {
 }
 
 
+# Config members are all class-level, so one instance per environment is
+# enough; get_config hands these out instead of allocating per call.
+_CONFIG_SINGLETONS = {name: cls() for name, cls in config_map.items()}
+
+
 def get_config(env: Optional[str] = None) -> Config:
     """Get configuration based on environment"""
-    env = env or os.getenv('FLASK_ENV', 'development')
-    return config_map.get(env, DevelopmentConfig)()
\ No newline at end of file
+    env = env or _FLASK_ENV
+    return _CONFIG_SINGLETONS.get(env, _CONFIG_SINGLETONS['development'])
\ No newline at end of file
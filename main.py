@@ -3,15 +3,16 @@ Main application entry point for SOC Agent Automation.
 """
 import streamlit as st
 import asyncio
-import pandas as pd
+import queue
+import threading
 from typing import List, Dict, Any
 
-# Import from new structured modules
-from src.core.agent import init_agent, run_agent
-from src.database.models import init_db, get_all_messages
-from src.core.proactive_agents import add_proactive_agent, remove_proactive_agent
-from src.ui.dashboard import render_dashboard
-from src.ui.chat import get_chat_interface
+# Import from new structured modules. Heavy UI modules (dashboard, chat)
+# are imported lazily where they are used so reruns that don't touch them
+# skip the import cost.
+from src.core.agent import init_agent, run_agent, stream_agent
+from src.database.models import init_db, count_messages, get_recent_messages
+from src.core.proactive_agents import add_proactive_agent_async, remove_proactive_agent_async
 from config.settings import Config
 
 # Configure Streamlit
@@ -30,20 +31,76 @@ except Exception as e:
     st.error(f"Configuration error: {e}")
     st.stop()
 
+@st.cache_resource
+def _get_agent():
+    """Initialize the MCP agent once per process, shared across sessions"""
+    return init_agent()
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _load_sidebar_messages() -> tuple:
+    """Load the message count and recent previews for the sidebar.
+
+    Cached briefly so ordinary widget reruns skip the DB round-trip; cleared
+    explicitly after a chat submission so new messages show immediately.
+    """
+    return count_messages(), get_recent_messages(5, content_limit=51)
+
+
+@st.cache_resource
+def _init_db_once() -> bool:
+    """Create database tables once per process instead of per rerun"""
+    init_db()
+    return True
+
+
 # Initialize database
 try:
-    init_db()
+    _init_db_once()
 except Exception as e:
     st.warning(f"Database initialization warning: {e}")
 
+@st.cache_data
+def _title_markdown() -> str:
+    """Static subtitle markdown, built once and reused across reruns"""
+    return "*MCP + Wazuh Chat with Proactive Agents & Dashboard*"
+
+
+@st.cache_data
+def _footer_html() -> str:
+    """Static sidebar footer HTML, built once and reused across reruns"""
+    return """
+    <div style='text-align: center; color: #666;'>
+        <small>
+        SOC Agent Automation v1.0<br/>
+        Powered by MCP + Groq + Wazuh
+        </small>
+    </div>
+    """
+
+
 # Main application title
 st.title("🤖 SOC Agent Automation Platform")
-st.markdown("*MCP + Wazuh Chat with Proactive Agents & Dashboard*")
+st.markdown(_title_markdown())
+
+@st.cache_resource
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the persistent background event loop shared by all sessions.
+
+    Creating and tearing down a loop per chat message (asyncio.run) breaks
+    connection reuse in the agent's HTTP clients; a single loop on a daemon
+    thread survives Streamlit reruns and is shared process-wide, matching
+    the cached agent singleton it drives.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
 
 # Initialize session state
 if "agent" not in st.session_state:
     try:
-        st.session_state.agent = init_agent()
+        st.session_state.agent = _get_agent()
     except Exception as e:
         st.error(f"Failed to initialize agent: {e}")
         st.stop()
@@ -61,16 +118,15 @@ else:
 # Chat History in Sidebar
 st.sidebar.header("💬 Recent Activity")
 try:
-    conversations = pd.DataFrame(get_all_messages())
-    if not conversations.empty:
-        recent_count = min(10, len(conversations))
-        st.sidebar.info(f"📊 {len(conversations)} total messages")
-        
-        # Show last few messages
-        recent_messages = conversations.tail(5)
-        for _, msg in recent_messages.iterrows():
-            role_icon = "👤" if msg["role"] == "user" else "🤖"
-            truncated_content = msg["content"][:50] + "..." if len(msg["content"]) > 50 else msg["content"]
+    total_messages, recent_messages = _load_sidebar_messages()
+    if total_messages:
+        st.sidebar.info(f"📊 {total_messages} total messages")
+
+        # Show last few messages; fetch one char past the display cutoff so
+        # truncation is decided without pulling full message bodies
+        for role, content in recent_messages:
+            role_icon = "👤" if role == "user" else "🤖"
+            truncated_content = content[:50] + "..." if len(content) > 50 else content
             st.sidebar.caption(f"{role_icon} {truncated_content}")
     else:
         st.sidebar.info("No conversation history yet")
@@ -83,38 +139,82 @@ tab1, tab2, tab3 = st.tabs(["💬 Chat Interface", "⚙️ Proactive Agents", "
 # Chat Tab
 with tab1:
     st.header("💬 Interactive Chat")
-    
+
     # Get chat interface and set up agent runner
+    from src.ui.chat import get_chat_interface
+
     chat_interface = get_chat_interface()
     
-    async def agent_runner(prompt: str, previous_messages: List[Dict[str, Any]]) -> str:
+    async def agent_runner(agent, prompt: str, previous_messages: List[Dict[str, Any]]) -> str:
         """Run agent with proper error handling"""
         try:
-            result = await run_agent(st.session_state.agent, prompt, previous_messages)
+            result = await run_agent(agent, prompt, previous_messages)
             return result
         except Exception as e:
             return f"❌ Error: {str(e)}"
-    
+
     def sync_agent_runner(prompt: str, previous_messages: List[Dict[str, Any]]) -> str:
         """Synchronous wrapper for agent runner"""
         try:
-            return asyncio.run(agent_runner(prompt, previous_messages))
+            # Resolve the agent here on the script thread: session state is
+            # bound to the ScriptRunContext and isn't visible from the
+            # background loop thread the coroutine runs on
+            agent = st.session_state.agent
+            loop = _get_event_loop()
+            future = asyncio.run_coroutine_threadsafe(
+                agent_runner(agent, prompt, previous_messages), loop
+            )
+            result = future.result()
+            # New messages were written; drop the cached sidebar snapshot
+            _load_sidebar_messages.clear()
+            return result
         except Exception as e:
             return f"❌ Error running agent: {str(e)}"
+
+    def stream_agent_runner(prompt: str, previous_messages: List[Dict[str, Any]]):
+        """Yield agent response chunks from the background loop as they arrive"""
+        chunks: queue.Queue = queue.Queue()
+        sentinel = object()
+        loop = _get_event_loop()
+        # Read session state here, not in the coroutine: the background
+        # loop thread has no ScriptRunContext to resolve it against
+        agent = st.session_state.agent
+
+        async def _pump():
+            try:
+                async for chunk in stream_agent(agent, prompt, previous_messages):
+                    chunks.put(chunk)
+            except Exception as e:
+                chunks.put(f"❌ Error running agent: {str(e)}")
+            finally:
+                chunks.put(sentinel)
+
+        asyncio.run_coroutine_threadsafe(_pump(), loop)
+
+        while (chunk := chunks.get()) is not sentinel:
+            yield chunk
+
+        # New messages were written; drop the cached sidebar snapshot
+        _load_sidebar_messages.clear()
     
-    # Render chat interface with agent runner
-    chat_interface.render_chat_tab(agent_runner_callback=sync_agent_runner)
+    # Render chat interface with agent runner (streaming preferred)
+    chat_interface.render_chat_tab(
+        agent_runner_callback=sync_agent_runner,
+        agent_stream_callback=stream_agent_runner
+    )
 
 # Proactive Agents Tab
-with tab2:
+@st.fragment
+def _render_agents_tab():
+    """Proactive agent management; re-runs only on its own interactions"""
     st.header("⚙️ Proactive Agent Management")
-    
+
     col1, col2 = st.columns([2, 1])
-    
+
     with col1:
         st.subheader("➕ Add New Proactive Agent")
         
-        with st.form("add_agent_form"):
+        with st.form("add_agent_form", clear_on_submit=True):
             agent_name = st.text_input(
                 "Agent Name", 
                 placeholder="e.g., security_monitor",
@@ -148,14 +248,19 @@ with tab2:
             if submitted:
                 if agent_name and agent_prompt:
                     try:
-                        add_proactive_agent(
-                            agent_name, 
-                            interval_minutes, 
-                            agent_prompt, 
-                            st.session_state.agent, 
-                            retries
+                        # Schedule on the background loop so the rerun
+                        # doesn't wait on DB writes and scheduler setup
+                        asyncio.run_coroutine_threadsafe(
+                            add_proactive_agent_async(
+                                agent_name,
+                                interval_minutes,
+                                agent_prompt,
+                                st.session_state.agent,
+                                retries
+                            ),
+                            _get_event_loop()
                         )
-                        st.success(f"✅ Added proactive agent '{agent_name}' with {interval_minutes} minute interval")
+                        st.success(f"✅ Scheduled proactive agent '{agent_name}' with {interval_minutes} minute interval")
                     except Exception as e:
                         st.error(f"❌ Error adding agent: {e}")
                 else:
@@ -173,8 +278,11 @@ with tab2:
         if st.button("Remove Agent"):
             if remove_name:
                 try:
-                    remove_proactive_agent(remove_name)
-                    st.success(f"✅ Removed proactive agent '{remove_name}'")
+                    asyncio.run_coroutine_threadsafe(
+                        remove_proactive_agent_async(remove_name),
+                        _get_event_loop()
+                    )
+                    st.success(f"✅ Scheduled removal of proactive agent '{remove_name}'")
                 except Exception as e:
                     st.error(f"❌ Error removing agent: {e}")
             else:
@@ -184,26 +292,28 @@ with tab2:
     st.subheader("📊 Agent Status")
     st.info("Proactive agent status monitoring will be displayed here")
 
-# Dashboard Tab  
-with tab3:
+
+# Dashboard Tab
+@st.fragment(run_every="30s")
+def _render_dashboard_tab():
+    """Dashboard rendering; refreshes on its own timer, not on chat reruns"""
     st.header("📊 SOC Automation Dashboard")
-    
+
     try:
+        from src.ui.dashboard import render_dashboard
+
         render_dashboard()
     except Exception as e:
         st.error(f"Error rendering dashboard: {e}")
         st.info("Dashboard features are being loaded...")
 
+
+with tab2:
+    _render_agents_tab()
+
+with tab3:
+    _render_dashboard_tab()
+
 # Footer
 st.sidebar.markdown("---")
-st.sidebar.markdown(
-    f"""
-    <div style='text-align: center; color: #666;'>
-        <small>
-        SOC Agent Automation v1.0<br/>
-        Powered by MCP + Groq + Wazuh
-        </small>
-    </div>
-    """, 
-    unsafe_allow_html=True
-)
\ No newline at end of file
+st.sidebar.markdown(_footer_html(), unsafe_allow_html=True)
\ No newline at end of file
@@ -19,7 +19,7 @@ def read_requirements():
             return [line.strip() for line in fh if line.strip() and not line.startswith("#")]
     except FileNotFoundError:
         return [
-            "streamlit>=1.28.0",
+            "streamlit>=1.37.0",
             "mcp-use>=0.1.0", 
             "langchain-groq>=0.1.0",
             "python-dotenv>=1.0.0",
@@ -64,6 +64,7 @@ setup(
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
         ]
     },
     entry_points={
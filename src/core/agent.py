@@ -1,13 +1,63 @@
 """
 Agent management module for MCP + Groq integration.
 """
-import asyncio
-from typing import List, Dict, Any, Optional
+from __future__ import annotations
 
-from mcp_use import MCPAgent, MCPClient
-from langchain_groq import ChatGroq
+import asyncio
+import functools
+import hashlib
+import json
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 
 from config.settings import Config
+from src.database.models import DatabaseManager
+
+if TYPE_CHECKING:
+    from mcp_use import MCPAgent, MCPClient
+    from langchain_groq import ChatGroq
+
+@functools.lru_cache(maxsize=4)
+def _mk_client(config_json: str) -> "MCPClient":
+    """Build (or reuse) an MCPClient for a given serialized config"""
+    from mcp_use import MCPClient
+    return MCPClient.from_dict(json.loads(config_json))
+
+
+@functools.lru_cache(maxsize=4)
+def _mk_llm(model: str, api_key: str) -> "ChatGroq":
+    """Build (or reuse) a ChatGroq client for a given model/key pair"""
+    from langchain_groq import ChatGroq
+    return ChatGroq(model=model, api_key=api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def _cache_db() -> DatabaseManager:
+    """Database manager backing the persistent agent response cache"""
+    return DatabaseManager()
+
+
+def _response_cache_key(model: str, previous_messages: List[Dict[str, str]],
+                        prompt: str, max_steps: int) -> str:
+    """Hash the full conversation state into a stable cache key"""
+    payload = json.dumps(
+        {"m": model, "h": previous_messages, "p": prompt, "s": max_steps},
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.blake2b(payload.encode()).hexdigest()
+
+
+# Cap in-flight agent runs across sessions so a burst of users cannot
+# stampede the Groq API into rate limits
+_RUN_SEMAPHORE = asyncio.Semaphore(Config.MAX_CONCURRENCY)
+
+
+def _build_context_prompt(previous_messages: List[Dict[str, str]]) -> str:
+    """Build the role-prefixed context string for a message history"""
+    return "\n".join(
+        f"{msg['role']}: {msg['content']}"
+        for msg in previous_messages
+    )
 
 
 class SOCAgent:
@@ -18,6 +68,7 @@ class SOCAgent:
         self._agent: Optional[MCPAgent] = None
         self._client: Optional[MCPClient] = None
         self._llm: Optional[ChatGroq] = None
+        self._accepts_messages: Optional[bool] = None
         
     def _validate_config(self) -> None:
         """Validate required configuration"""
@@ -30,17 +81,18 @@ class SOCAgent:
     
     def initialize(self) -> MCPAgent:
         """Initialize the MCP agent with Groq LLM"""
+        # Imported here so merely importing this module (e.g. for the legacy
+        # helpers) doesn't pay the mcp_use/langchain cold-start cost
+        from mcp_use import MCPAgent
+
         self._validate_config()
-        
-        # Initialize MCP client
+
+        # MCP client and LLM are memoized on their config so repeated
+        # initialization reuses live clients instead of respawning them
         mcp_config = self.config.get_mcp_config()
-        self._client = MCPClient.from_dict(mcp_config)
-        
-        # Initialize Groq LLM
-        self._llm = ChatGroq(
-            model=self.config.GROQ_MODEL,
-            api_key=self.config.GROQ_API_KEY
-        )
+        self._client = _mk_client(json.dumps(mcp_config, sort_keys=True, default=dict))
+
+        self._llm = _mk_llm(self.config.GROQ_MODEL, self.config.GROQ_API_KEY)
         
         # Initialize MCP Agent with max_steps
         self._agent = MCPAgent(
@@ -57,6 +109,17 @@ class SOCAgent:
         if self._agent is None:
             return self.initialize()
         return self._agent
+
+    def _supports_message_history(self) -> bool:
+        """Check (once) whether agent.run accepts a structured message list"""
+        if self._accepts_messages is None:
+            import inspect
+            try:
+                params = inspect.signature(self.agent.run).parameters
+                self._accepts_messages = "messages" in params
+            except (TypeError, ValueError):
+                self._accepts_messages = False
+        return self._accepts_messages
     
     async def run(self, prompt: str, previous_messages: List[Dict[str, str]] = None, 
                   max_steps: Optional[int] = None) -> str:
@@ -75,18 +138,74 @@ class SOCAgent:
         max_steps = max_steps or self.config.MAX_AGENT_STEPS
         
         # Build context from previous messages
-        context_prompt = "\\n".join([
-            f"{msg['role']}: {msg['content']}" 
-            for msg in previous_messages
-        ])
+        context_prompt = _build_context_prompt(previous_messages)
         
         # Construct full prompt with context
-        full_prompt = f"{context_prompt}\\nUser: {prompt}\\nAssistant:" if context_prompt else prompt
-        
-        # Run the agent
+        full_prompt = f"{context_prompt}\nUser: {prompt}\nAssistant:" if context_prompt else prompt
+
+        # Check the persistent response cache for a replayed conversation
+        cache_key = None
+        cache_ttl = getattr(self.config, "AGENT_CACHE_TTL", 0)
+        if cache_ttl > 0:
+            cache_key = _response_cache_key(
+                self.config.GROQ_MODEL, previous_messages, prompt, max_steps
+            )
+            try:
+                cached = _cache_db().get_cached_response(cache_key, max_age_seconds=cache_ttl)
+            except Exception:
+                cached = None
+            if cached is not None:
+                return cached
+
+        # Run the agent. Prefer passing history as a structured message
+        # list so prior turns stay separate (and server-side caching can
+        # apply); fall back to the flattened prompt otherwise.
         try:
-            result = await self.agent.run(full_prompt, max_steps=max_steps)
-            return result
+            async with _RUN_SEMAPHORE:
+                if previous_messages and self._supports_message_history():
+                    messages = [
+                        {"role": m["role"], "content": m["content"]}
+                        for m in previous_messages
+                    ]
+                    result = await self.agent.run(prompt, max_steps=max_steps, messages=messages)
+                else:
+                    result = await self.agent.run(full_prompt, max_steps=max_steps)
+        except Exception as e:
+            raise RuntimeError(f"Agent execution failed: {str(e)}")
+
+        if cache_key is not None:
+            try:
+                _cache_db().save_cached_response(
+                    cache_key, result, max_age_seconds=cache_ttl
+                )
+            except Exception:
+                pass
+
+        return result
+
+    async def stream(self, prompt: str, previous_messages: List[Dict[str, str]] = None,
+                     max_steps: Optional[int] = None):
+        """
+        Stream the agent response as it is generated.
+
+        Yields response chunks when the underlying agent supports streaming,
+        otherwise yields the full response once.
+        """
+        previous_messages = previous_messages or []
+        max_steps = max_steps or self.config.MAX_AGENT_STEPS
+
+        context_prompt = _build_context_prompt(previous_messages)
+        full_prompt = f"{context_prompt}\nUser: {prompt}\nAssistant:" if context_prompt else prompt
+
+        try:
+            async with _RUN_SEMAPHORE:
+                astream = getattr(self.agent, "astream", None)
+                if astream is None:
+                    yield await self.agent.run(full_prompt, max_steps=max_steps)
+                    return
+
+                async for chunk in astream(full_prompt, max_steps=max_steps):
+                    yield chunk
         except Exception as e:
             raise RuntimeError(f"Agent execution failed: {str(e)}")
 
@@ -104,20 +223,25 @@ def init_agent() -> MCPAgent:
     return _global_agent_instance
 
 
+@functools.lru_cache(maxsize=1)
+def _cfg() -> Config:
+    """Shared Config instance for the legacy module-level helpers"""
+    return Config()
+
+
+def _wrap_agent(agent: MCPAgent) -> SOCAgent:
+    """Wrap an already-initialized MCPAgent in a SOCAgent"""
+    soc_agent = SOCAgent(_cfg())
+    soc_agent._agent = agent
+    return soc_agent
+
+
 async def run_agent(agent: MCPAgent, prompt: str, previous_messages: List[Dict[str, str]] = None) -> str:
     """Run agent with prompt (legacy function)"""
-    previous_messages = previous_messages or []
-    config = Config()
-    
-    # Build context from previous messages
-    context_prompt = "\\n".join([
-        f"{msg['role']}: {msg['content']}" 
-        for msg in previous_messages
-    ])
-    
-    # Construct full prompt
-    full_prompt = f"{context_prompt}\\nUser: {prompt}\\nAssistant:" if context_prompt else prompt
-    
-    # Run with configured max_steps
-    result = await agent.run(full_prompt, max_steps=config.MAX_AGENT_STEPS)
-    return result
\ No newline at end of file
+    return await _wrap_agent(agent).run(prompt, previous_messages)
+
+
+async def stream_agent(agent: MCPAgent, prompt: str, previous_messages: List[Dict[str, str]] = None):
+    """Stream agent response chunks (legacy function)"""
+    async for chunk in _wrap_agent(agent).stream(prompt, previous_messages):
+        yield chunk
\ No newline at end of file
@@ -3,6 +3,7 @@ Proactive agents module for scheduled task execution.
 """
 import asyncio
 import logging
+import threading
 from typing import Dict, Any, Optional
 from apscheduler.schedulers.background import BackgroundScheduler
 
@@ -21,7 +22,9 @@ class ProactiveAgentManager:
         self.db_manager = db_manager or DatabaseManager()
         self._scheduler: Optional[BackgroundScheduler] = None
         self._jobs: Dict[str, Any] = {}
-        
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._log_queue: Optional[asyncio.Queue] = None
+
     @property
     def scheduler(self) -> BackgroundScheduler:
         """Get or create the background scheduler"""
@@ -29,7 +32,40 @@ class ProactiveAgentManager:
             self._scheduler = BackgroundScheduler()
             self._scheduler.start()
         return self._scheduler
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Get or create the long-lived event loop shared by all agent tasks"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        return self._loop
     
+    def _enqueue_log(self, name: str, message: str, usage: str) -> None:
+        """Queue a job outcome for the batch writer (started on first use)"""
+        if self._log_queue is None:
+            self._log_queue = asyncio.Queue()
+            asyncio.run_coroutine_threadsafe(self._log_writer(), self.loop)
+        self._log_queue.put_nowait((name, message, usage))
+
+    async def _log_writer(self) -> None:
+        """Drain queued job outcomes and persist them in batched commits"""
+        while True:
+            batch = [await self._log_queue.get()]
+
+            # Brief window to coalesce bursts into a single commit
+            await asyncio.sleep(0.5)
+            while len(batch) < 50:
+                try:
+                    batch.append(self._log_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                self.db_manager.save_proactive_events(batch)
+            except Exception as e:
+                logger.error(f"Failed to persist proactive log batch: {e}")
+
     async def _execute_agent_task(self, name: str, prompt: str, agent_obj: Any, retries: int = 2) -> None:
         """Execute a proactive agent task"""
         attempt = 0
@@ -45,13 +81,13 @@ class ProactiveAgentManager:
                     max_steps=config.MAX_AGENT_STEPS
                 )
                 
-                # Save successful execution
-                self.db_manager.save_message(
-                    "assistant", 
-                    f"🔔 [{name}] Proactive Update:\\n{response}"
+                # Queue the outcome; the writer batches the three DB writes
+                # into one commit off the execution path
+                self._enqueue_log(
+                    name,
+                    f"🔔 [{name}] Proactive Update:\\n{response}",
+                    f"Prompt executed: {prompt}"
                 )
-                self.db_manager.save_tool_log(name, f"Prompt executed: {prompt}")
-                self.db_manager.update_proactive_agent_last_run(name)
                 
                 logger.info(f"Proactive agent '{name}' executed successfully")
                 break
@@ -70,30 +106,15 @@ class ProactiveAgentManager:
         """Create a wrapper function for the scheduler job"""
         def run_async_job():
             try:
-                # Try to run in existing event loop
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # Create a task in the existing loop
-                    asyncio.create_task(
-                        self._execute_agent_task(name, prompt, agent_obj, retries)
-                    )
-                else:
-                    # Run in new event loop
-                    asyncio.run(
-                        self._execute_agent_task(name, prompt, agent_obj, retries)
-                    )
-            except RuntimeError:
-                # Fallback: create new event loop
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    loop.run_until_complete(
-                        self._execute_agent_task(name, prompt, agent_obj, retries)
-                    )
-                    loop.close()
-                except Exception as e:
-                    logger.error(f"Failed to execute proactive agent '{name}': {e}")
-        
+                # Submit to the manager's long-lived loop; no per-fire loop
+                # construction, and the agent's connection pools stay warm
+                asyncio.run_coroutine_threadsafe(
+                    self._execute_agent_task(name, prompt, agent_obj, retries),
+                    self.loop
+                )
+            except Exception as e:
+                logger.error(f"Failed to execute proactive agent '{name}': {e}")
+
         return run_async_job
     
     def add_proactive_agent(self, name: str, interval_minutes: int, prompt: str, 
@@ -179,7 +200,24 @@ class ProactiveAgentManager:
         if self._scheduler:
             self._scheduler.shutdown()
             self._jobs.clear()
-            logger.info("Proactive agent manager shutdown completed")
+        if self._log_queue is not None:
+            # Flush anything the batch writer hasn't persisted yet
+            pending = []
+            while True:
+                try:
+                    pending.append(self._log_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            if pending:
+                try:
+                    self.db_manager.save_proactive_events(pending)
+                except Exception as e:
+                    logger.error(f"Failed to flush proactive log batch: {e}")
+            self._log_queue = None
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+        logger.info("Proactive agent manager shutdown completed")
 
 
 # Global manager instance
@@ -204,4 +242,21 @@ def add_proactive_agent(name: str, interval_minutes: int, prompt: str, agent_obj
 def remove_proactive_agent(name: str):
     """Remove proactive agent (legacy function)"""
     manager = get_manager()
-    manager.remove_proactive_agent(name)
\ No newline at end of file
+    manager.remove_proactive_agent(name)
+
+
+async def add_proactive_agent_async(name: str, interval_minutes: int, prompt: str,
+                                    agent_obj: Any, retries: int = 2):
+    """Async wrapper so UI threads can schedule the add off the hot path"""
+    try:
+        add_proactive_agent(name, interval_minutes, prompt, agent_obj, retries)
+    except Exception as e:
+        logger.error(f"Failed to add proactive agent '{name}': {e}")
+
+
+async def remove_proactive_agent_async(name: str):
+    """Async wrapper so UI threads can schedule the removal off the hot path"""
+    try:
+        remove_proactive_agent(name)
+    except Exception as e:
+        logger.error(f"Failed to remove proactive agent '{name}': {e}")
\ No newline at end of file
@@ -1,85 +1,254 @@
 """
 Database models and operations for SOC Agent Automation.
 """
+import queue
 import sqlite3
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from contextlib import contextmanager
 
 from config.settings import Config
 
 
+# Last formatted timestamp, keyed by whole second. Row timestamps only need
+# second precision (ordering uses the id column), so burst writes reuse one
+# formatted string instead of allocating a datetime + isoformat() per row.
+_last_ts = (0, "")
+
+
+def _iso_now() -> str:
+    """Current time as an ISO string, cached at one-second granularity"""
+    global _last_ts
+    sec = int(time.time())
+    if _last_ts[0] != sec:
+        _last_ts = (sec, datetime.fromtimestamp(sec).isoformat())
+    return _last_ts[1]
+
+
+# Full schema as one script: init_db hands this to executescript in a
+# single round-trip instead of a dozen separate execute calls, each of
+# which re-enters the SQLite parser. Every statement is idempotent.
+_SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS messages (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        role TEXT NOT NULL,
+        content TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        session_id TEXT DEFAULT 'default'
+    );
+
+    CREATE TABLE IF NOT EXISTS tools_log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        tool_name TEXT NOT NULL,
+        usage TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        session_id TEXT DEFAULT 'default'
+    );
+
+    CREATE TABLE IF NOT EXISTS preferences (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        proactive_enabled INTEGER DEFAULT 1,
+        proactive_interval INTEGER DEFAULT 60,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS proactive_agents (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL UNIQUE,
+        prompt TEXT NOT NULL,
+        interval_minutes INTEGER NOT NULL,
+        enabled INTEGER DEFAULT 1,
+        last_run TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS agent_response_cache (
+        key TEXT PRIMARY KEY,
+        response TEXT NOT NULL,
+        created_at TEXT NOT NULL
+    );
+
+    -- Sessions table: listing sessions reads this tiny table instead of a
+    -- DISTINCT scan over all messages
+    CREATE TABLE IF NOT EXISTS sessions (
+        session_id TEXT PRIMARY KEY,
+        created_at TEXT NOT NULL
+    );
+
+    -- Backfill from pre-existing message history
+    INSERT OR IGNORE INTO sessions (session_id, created_at)
+    SELECT session_id, MIN(timestamp) FROM messages GROUP BY session_id;
+
+    -- Session filters scan these tables on every history read; composite
+    -- (session_id, id) indexes make them index seeks that also cover the
+    -- ORDER BY id
+    CREATE INDEX IF NOT EXISTS idx_messages_session ON messages(session_id, id);
+    CREATE INDEX IF NOT EXISTS idx_tools_session ON tools_log(session_id, id);
+
+    -- Timestamp indexes for the dashboard's rolling-window queries and
+    -- per-session stats, which filter on timestamp ranges
+    CREATE INDEX IF NOT EXISTS idx_messages_session_ts ON messages(session_id, timestamp DESC);
+    CREATE INDEX IF NOT EXISTS idx_tools_session_ts ON tools_log(session_id, timestamp DESC);
+    CREATE INDEX IF NOT EXISTS idx_messages_ts ON messages(timestamp DESC);
+    CREATE INDEX IF NOT EXISTS idx_tools_ts ON tools_log(timestamp DESC);
+"""
+
+
+# Write-version shared by every DatabaseManager in the process. Several
+# independent managers (chat, dashboard, proactive agents, response cache)
+# write the same database file, so read caches keyed on a per-instance
+# counter would stay stale after another manager's writes.
+_write_version = 0
+_version_lock = threading.Lock()
+
+
+def _bump_version() -> None:
+    """Advance the process-wide database write-version.
+
+    Call only after the commit: readers poll this value without the writer
+    lock, and advancing it early would let them cache pre-commit snapshots
+    under the new version.
+    """
+    global _write_version
+    with _version_lock:
+        _write_version += 1
+
+
+def _message_row(_cursor, row) -> Dict[str, Any]:
+    """Row factory materializing message rows as dicts at fetch time"""
+    return {"role": row[0], "content": row[1], "timestamp": row[2]}
+
+
+def _tool_log_row(_cursor, row) -> Dict[str, Any]:
+    """Row factory materializing tool log rows as dicts at fetch time"""
+    return {"tool_name": row[0], "usage": row[1], "timestamp": row[2]}
+
+
 class DatabaseManager:
     """Database manager for SQLite operations"""
-    
+
+    # Size of the read connection pool; in WAL mode these run concurrently
+    # with each other and with the single writer
+    READ_POOL_SIZE = 4
+
     def __init__(self, db_file: str = None):
         self.db_file = db_file or Config.DATABASE_FILE
-    
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._read_pool: Optional[queue.Queue] = None
+        # Session ids already registered in the sessions table, so the hot
+        # write path skips the upsert after the first message of a session
+        self._known_sessions = set()
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter incremented on every write in this process.
+
+        Shared across manager instances: a write through any of them
+        invalidates caches keyed on this value.
+        """
+        return _write_version
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get or create the shared connection for this manager"""
+        if self._conn is None:
+            # One long-lived connection per manager: SQLite's page cache and
+            # per-connection prepared-statement cache survive across calls
+            # instead of being rebuilt on every operation. Access is
+            # serialized by self._lock, so sharing across threads is safe.
+            self._conn = self._open_connection()
+        return self._conn
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a new tuned connection to the database file"""
+        conn = sqlite3.connect(
+            self.db_file,
+            check_same_thread=False,
+            cached_statements=256
+        )
+        if Config.SQLITE_TUNING:
+            # WAL + relaxed fsync: commits no longer block on a full
+            # journal fsync, and readers don't block the writer. The
+            # remaining pragmas keep temp structures and hot pages in
+            # memory. Safe to skip via SQLITE_TUNING=false (e.g. tests
+            # on constrained filesystems).
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-65536")
+            conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
     @contextmanager
     def get_connection(self):
-        """Get database connection with automatic cleanup"""
-        conn = sqlite3.connect(self.db_file)
+        """Get the shared write connection (serialized by a lock)"""
+        with self._lock:
+            yield self._connect()
+
+    @contextmanager
+    def get_read_connection(self):
+        """Get a pooled read connection.
+
+        Reads on these connections run concurrently with writes on the
+        shared writer connection under WAL, so dashboard renders never wait
+        behind chat inserts. An in-memory database is private to each
+        connection, so that case falls back to the shared writer.
+        """
+        if self.db_file == ":memory:":
+            with self.get_connection() as conn:
+                yield conn
+            return
+
+        if self._read_pool is None:
+            with self._lock:
+                if self._read_pool is None:
+                    pool = queue.Queue()
+                    # Slots are populated lazily on first checkout
+                    for _ in range(self.READ_POOL_SIZE):
+                        pool.put(None)
+                    self._read_pool = pool
+
+        conn = self._read_pool.get()
+        if conn is None:
+            conn = self._open_connection()
         try:
             yield conn
         finally:
-            conn.close()
+            self._read_pool.put(conn)
+
+    def close(self) -> None:
+        """Close the shared connection and any pooled readers"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            if self._read_pool is not None:
+                while True:
+                    try:
+                        conn = self._read_pool.get_nowait()
+                    except queue.Empty:
+                        break
+                    if conn is not None:
+                        conn.close()
+                self._read_pool = None
     
     def init_db(self) -> None:
         """Initialize database tables"""
         with self.get_connection() as conn:
+            # Whole schema in one executescript round-trip
+            conn.executescript(_SCHEMA_SQL)
+
             cursor = conn.cursor()
-            
-            # Messages table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS messages (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    role TEXT NOT NULL,
-                    content TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    session_id TEXT DEFAULT 'default'
-                )
-            """)
-            
-            # Tools log table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tools_log (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    tool_name TEXT NOT NULL,
-                    usage TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    session_id TEXT DEFAULT 'default'
-                )
-            """)
-            
-            # User preferences table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS preferences (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    proactive_enabled INTEGER DEFAULT 1,
-                    proactive_interval INTEGER DEFAULT 60,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-            """)
-            
-            # Proactive agents table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS proactive_agents (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL UNIQUE,
-                    prompt TEXT NOT NULL,
-                    interval_minutes INTEGER NOT NULL,
-                    enabled INTEGER DEFAULT 1,
-                    last_run TEXT,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-            """)
-            
+
             # Initialize default preferences if not exists
             cursor.execute("SELECT COUNT(*) FROM preferences")
             if cursor.fetchone()[0] == 0:
-                now = datetime.now().isoformat()
+                now = _iso_now()
                 cursor.execute(
                     "INSERT INTO preferences (proactive_enabled, proactive_interval, created_at, updated_at) VALUES (?,?,?,?)",
                     (1, Config.DEFAULT_PROACTIVE_INTERVAL, now, now)
@@ -89,76 +258,178 @@ class DatabaseManager:
     
     def save_message(self, role: str, content: str, session_id: str = "default") -> int:
         """Save a chat message"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        # Hot write path: take the lock directly instead of going through
+        # the get_connection generator machinery
+        with self._lock:
+            conn = self._connect()
+            if session_id not in self._known_sessions:
+                conn.execute(
+                    "INSERT OR IGNORE INTO sessions (session_id, created_at) VALUES (?,?)",
+                    (session_id, _iso_now())
+                )
+                self._known_sessions.add(session_id)
+            cursor = conn.execute(
                 "INSERT INTO messages (role, content, timestamp, session_id) VALUES (?,?,?,?)",
-                (role, content, datetime.now().isoformat(), session_id)
+                (role, content, _iso_now(), session_id)
             )
             conn.commit()
+            _bump_version()
             return cursor.lastrowid
-    
+
+    def save_messages_bulk(self, rows: List[tuple]) -> int:
+        """Save many (role, content, session_id) messages in one transaction.
+
+        One commit (and thus one fsync) covers the whole batch instead of
+        one per row, which is where bulk ingestion time goes in SQLite.
+        Returns the number of rows inserted.
+        """
+        if not rows:
+            return 0
+        now = _iso_now()
+        with self._lock:
+            conn = self._connect()
+            sessions = {session_id for _, _, session_id in rows}
+            new_sessions = sessions - self._known_sessions
+            if new_sessions:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO sessions (session_id, created_at) VALUES (?,?)",
+                    [(session_id, now) for session_id in new_sessions]
+                )
+                self._known_sessions.update(new_sessions)
+            conn.executemany(
+                "INSERT INTO messages (role, content, timestamp, session_id) VALUES (?,?,?,?)",
+                [(role, content, now, session_id) for role, content, session_id in rows]
+            )
+            conn.commit()
+            _bump_version()
+            return len(rows)
+
+    def save_tool_logs_bulk(self, rows: List[tuple]) -> int:
+        """Save many (tool_name, usage, session_id) logs in one transaction.
+
+        Same single-commit batching as save_messages_bulk. Returns the
+        number of rows inserted.
+        """
+        if not rows:
+            return 0
+        now = _iso_now()
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT INTO tools_log (tool_name, usage, timestamp, session_id) VALUES (?,?,?,?)",
+                [(tool_name, usage, now, session_id) for tool_name, usage, session_id in rows]
+            )
+            conn.commit()
+            _bump_version()
+            return len(rows)
+
     def save_tool_log(self, tool_name: str, usage: str, session_id: str = "default") -> int:
         """Save a tool usage log"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        # Hot write path, same inlining as save_message
+        with self._lock:
+            conn = self._connect()
+            cursor = conn.execute(
                 "INSERT INTO tools_log (tool_name, usage, timestamp, session_id) VALUES (?,?,?,?)",
-                (tool_name, usage, datetime.now().isoformat(), session_id)
+                (tool_name, usage, _iso_now(), session_id)
             )
             conn.commit()
+            _bump_version()
             return cursor.lastrowid
     
+    def get_sessions(self) -> List[str]:
+        """Get all known session ids"""
+        with self.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT session_id FROM sessions ORDER BY session_id")
+            return [row[0] for row in cursor.fetchall()]
+
+    def delete_session(self, session_id: str) -> None:
+        """Delete a session with all of its messages and tool logs"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+            cursor.execute("DELETE FROM tools_log WHERE session_id = ?", (session_id,))
+            cursor.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            conn.commit()
+            _bump_version()
+        self._known_sessions.discard(session_id)
+
     def get_all_messages(self, session_id: str = None, limit: int = None) -> List[Dict[str, Any]]:
         """Get all messages, optionally filtered by session"""
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
+            # Dicts are built by the row factory while fetchall walks the
+            # result set, instead of a second Python pass over tuples
             cursor = conn.cursor()
-            
-            query = "SELECT role, content, timestamp FROM messages"
+            cursor.row_factory = _message_row
+
+            # One canonical query shape regardless of the session/limit
+            # combination, so the connection's prepared-statement cache
+            # always hits; LIMIT -1 means unlimited in SQLite
+            cursor.execute(
+                "SELECT role, content, timestamp FROM messages"
+                " WHERE (? IS NULL OR session_id = ?) ORDER BY id LIMIT ?",
+                (session_id, session_id, limit if limit else -1)
+            )
+            return cursor.fetchall()
+    
+    def count_messages(self, session_id: str = None) -> int:
+        """Count messages, optionally filtered by session"""
+        with self.get_read_connection() as conn:
+            cursor = conn.cursor()
+            if session_id:
+                cursor.execute("SELECT COUNT(*) FROM messages WHERE session_id = ?", (session_id,))
+            else:
+                cursor.execute("SELECT COUNT(*) FROM messages")
+            return cursor.fetchone()[0]
+
+    def get_recent_messages(self, limit: int = 5, session_id: str = None,
+                            content_limit: int = None) -> List[tuple]:
+        """Get the most recent messages as (role, content) tuples in chronological order.
+
+        If content_limit is given, message content is truncated to that many
+        characters in SQL so large messages never leave the database.
+        """
+        with self.get_read_connection() as conn:
+            cursor = conn.cursor()
+
             params = []
-            
+            if content_limit:
+                query = "SELECT role, substr(content, 1, ?) FROM messages"
+                params.append(content_limit)
+            else:
+                query = "SELECT role, content FROM messages"
+
             if session_id:
                 query += " WHERE session_id = ?"
                 params.append(session_id)
-            
-            query += " ORDER BY id"
-            
-            if limit:
-                query += " LIMIT ?"
-                params.append(limit)
-            
+
+            query += " ORDER BY id DESC LIMIT ?"
+            params.append(limit)
+
             cursor.execute(query, params)
             rows = cursor.fetchall()
-            
-            return [
-                {"role": row[0], "content": row[1], "timestamp": row[2]} 
-                for row in rows
-            ]
-    
+
+            # Rows come back newest-first; flip to chronological order
+            return rows[::-1]
+
     def get_all_tool_logs(self, session_id: str = None) -> List[Dict[str, Any]]:
         """Get all tool logs, optionally filtered by session"""
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.cursor()
             
-            query = "SELECT tool_name, usage, timestamp FROM tools_log"
-            params = []
-            
-            if session_id:
-                query += " WHERE session_id = ?"
-                params.append(session_id)
-                
-            query += " ORDER BY id"
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            
-            return [
-                {"tool_name": row[0], "usage": row[1], "timestamp": row[2]}
-                for row in rows
-            ]
+            cursor.row_factory = _tool_log_row
+
+            # Same canonical-shape trick as get_all_messages
+            cursor.execute(
+                "SELECT tool_name, usage, timestamp FROM tools_log"
+                " WHERE (? IS NULL OR session_id = ?) ORDER BY id",
+                (session_id, session_id)
+            )
+            return cursor.fetchall()
     
     def get_user_preferences(self) -> Dict[str, Any]:
         """Get user preferences"""
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT proactive_enabled, proactive_interval FROM preferences ORDER BY id DESC LIMIT 1"
@@ -175,45 +446,49 @@ class DatabaseManager:
         """Update user preferences"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            now = datetime.now().isoformat()
+            now = _iso_now()
             cursor.execute(
                 "UPDATE preferences SET proactive_enabled=?, proactive_interval=?, updated_at=? WHERE id=1",
                 (int(enabled), interval, now)
             )
             conn.commit()
+            _bump_version()
     
     def save_proactive_agent(self, name: str, prompt: str, interval_minutes: int) -> int:
         """Save or update a proactive agent configuration"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            now = datetime.now().isoformat()
-            
-            # Try to update existing agent first
+            now = _iso_now()
+
+            # Single UPSERT instead of the old UPDATE-then-INSERT pair: one
+            # statement for the prepared-statement cache and one index seek
+            # on the unique name either way
             cursor.execute(
-                "UPDATE proactive_agents SET prompt=?, interval_minutes=?, updated_at=? WHERE name=?",
-                (prompt, interval_minutes, now, name)
+                """
+                INSERT INTO proactive_agents (name, prompt, interval_minutes, created_at, updated_at)
+                VALUES (?,?,?,?,?)
+                ON CONFLICT(name) DO UPDATE SET
+                    prompt=excluded.prompt,
+                    interval_minutes=excluded.interval_minutes,
+                    updated_at=excluded.updated_at
+                """,
+                (name, prompt, interval_minutes, now, now)
             )
-            
-            if cursor.rowcount == 0:
-                # Insert new agent if update didn't affect any rows
-                cursor.execute(
-                    "INSERT INTO proactive_agents (name, prompt, interval_minutes, created_at, updated_at) VALUES (?,?,?,?,?)",
-                    (name, prompt, interval_minutes, now, now)
-                )
-            
+
             conn.commit()
+            _bump_version()
             return cursor.lastrowid
     
     def get_proactive_agents(self, enabled_only: bool = False) -> List[Dict[str, Any]]:
         """Get proactive agent configurations"""
-        with self.get_connection() as conn:
+        with self.get_read_connection() as conn:
             cursor = conn.cursor()
             
-            query = "SELECT name, prompt, interval_minutes, enabled, last_run FROM proactive_agents"
-            if enabled_only:
-                query += " WHERE enabled = 1"
-            
-            cursor.execute(query)
+            cursor.execute(
+                "SELECT name, prompt, interval_minutes, enabled, last_run FROM proactive_agents"
+                " WHERE (? = 0 OR enabled = 1)",
+                (int(enabled_only),)
+            )
             rows = cursor.fetchall()
             
             return [
@@ -227,22 +502,96 @@ class DatabaseManager:
                 for row in rows
             ]
     
+    def save_proactive_events(self, events: List[tuple]) -> None:
+        """Persist a batch of (name, message, usage) proactive job outcomes.
+
+        Writes the assistant message, the tool log entry and the last-run
+        update for every event in a single transaction, so a batch costs one
+        commit instead of three per job fire.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            now = _iso_now()
+
+            # Three executemany calls instead of 3*N execute calls: each
+            # statement is bound once and re-stepped per row in C
+            cursor.executemany(
+                "INSERT INTO messages (role, content, timestamp, session_id) VALUES (?,?,?,?)",
+                [("assistant", message, now, "default") for _, message, _ in events]
+            )
+            cursor.executemany(
+                "INSERT INTO tools_log (tool_name, usage, timestamp, session_id) VALUES (?,?,?,?)",
+                [(name, usage, now, "default") for name, _, usage in events]
+            )
+            cursor.executemany(
+                "UPDATE proactive_agents SET last_run=? WHERE name=?",
+                [(now, name) for name, _, _ in events]
+            )
+
+            conn.commit()
+            _bump_version()
+
     def update_proactive_agent_last_run(self, name: str) -> None:
         """Update last run timestamp for a proactive agent"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "UPDATE proactive_agents SET last_run=? WHERE name=?",
-                (datetime.now().isoformat(), name)
+                (_iso_now(), name)
             )
             conn.commit()
+            _bump_version()
     
+    def get_cached_response(self, key: str, max_age_seconds: int = None) -> Optional[str]:
+        """Get a cached agent response, or None if missing or expired"""
+        with self.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT response, created_at FROM agent_response_cache WHERE key=?",
+                (key,)
+            )
+            row = cursor.fetchone()
+
+            if row is None:
+                return None
+
+            if max_age_seconds is not None:
+                age = datetime.now() - datetime.fromisoformat(row[1])
+                if age.total_seconds() > max_age_seconds:
+                    return None
+
+            return row[0]
+
+    def save_cached_response(self, key: str, response: str,
+                             max_age_seconds: int = None) -> None:
+        """Save an agent response under a cache key.
+
+        Conversation-state keys almost never repeat, so without pruning the
+        cache table grows by roughly one row per agent run forever. Expired
+        rows are deleted in the same transaction as the insert when a TTL
+        is given.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            if max_age_seconds:
+                cutoff = (datetime.now() - timedelta(seconds=max_age_seconds)).isoformat()
+                cursor.execute(
+                    "DELETE FROM agent_response_cache WHERE created_at < ?",
+                    (cutoff,)
+                )
+            cursor.execute(
+                "INSERT OR REPLACE INTO agent_response_cache (key, response, created_at) VALUES (?,?,?)",
+                (key, response, _iso_now())
+            )
+            conn.commit()
+
     def delete_proactive_agent(self, name: str) -> None:
         """Delete a proactive agent"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM proactive_agents WHERE name=?", (name,))
             conn.commit()
+            _bump_version()
 
 
 # Global database instance
@@ -270,6 +619,16 @@ def get_all_messages():
     return _db.get_all_messages()
 
 
+def count_messages():
+    """Count messages (legacy function)"""
+    return _db.count_messages()
+
+
+def get_recent_messages(limit: int = 5, content_limit: int = None):
+    """Get recent messages (legacy function)"""
+    return _db.get_recent_messages(limit, content_limit=content_limit)
+
+
 def get_all_tool_logs():
     """Get all tool logs (legacy function)"""
     logs = _db.get_all_tool_logs()
@@ -13,10 +13,31 @@ class ChatManager:
     
     def __init__(self, db_manager: DatabaseManager = None):
         self.db_manager = db_manager or DatabaseManager()
-    
+        self._read_cache: Dict[Any, Any] = {}
+
+    def _cached_read(self, key, loader):
+        """Serve repeated reads from memory until the database changes.
+
+        Streamlit reruns the script on every interaction, so the sidebar
+        and history queries repeat with identical results; entries are
+        keyed on the manager's write-version counter so any write
+        invalidates them.
+        """
+        version = self.db_manager.version
+        hit = self._read_cache.get(key)
+        if hit is not None and hit[0] == version:
+            return hit[1]
+
+        value = loader()
+        self._read_cache[key] = (version, value)
+        return value
+
     def load_chat_history(self, session_id: str = "default", limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Load chat history for a session"""
-        return self.db_manager.get_all_messages(session_id=session_id, limit=limit)
+        return self._cached_read(
+            ("history", session_id, limit),
+            lambda: self.db_manager.get_all_messages(session_id=session_id, limit=limit)
+        )
     
     def save_user_message(self, message: str, session_id: str = "default") -> int:
         """Save user message to chat history"""
@@ -28,11 +49,9 @@ class ChatManager:
     
     def get_chat_sessions(self) -> List[str]:
         """Get list of available chat sessions"""
-        with self.db_manager.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT DISTINCT session_id FROM messages ORDER BY session_id")
-            rows = cursor.fetchall()
-            return [row[0] for row in rows]
+        # Reads the dedicated sessions table (maintained on write) instead
+        # of a DISTINCT scan over the whole messages table
+        return self._cached_read(("sessions",), self.db_manager.get_sessions)
     
     def create_new_session(self, session_id: str = None) -> str:
         """Create a new chat session"""
@@ -43,45 +62,56 @@ class ChatManager:
     
     def delete_chat_session(self, session_id: str) -> None:
         """Delete a chat session and all its messages"""
-        with self.db_manager.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
-            cursor.execute("DELETE FROM tools_log WHERE session_id = ?", (session_id,))
-            conn.commit()
+        self.db_manager.delete_session(session_id)
     
     def get_session_stats(self, session_id: str) -> Dict[str, Any]:
         """Get statistics for a chat session"""
-        with self.db_manager.get_connection() as conn:
+        return self._cached_read(
+            ("stats", session_id),
+            lambda: self._load_session_stats(session_id)
+        )
+
+    def _load_session_stats(self, session_id: str) -> Dict[str, Any]:
+        """Compute session statistics from the database"""
+        with self.db_manager.get_read_connection() as conn:
             cursor = conn.cursor()
-            
-            # Get message count by role
-            cursor.execute("""
-                SELECT role, COUNT(*) as count 
-                FROM messages 
-                WHERE session_id = ? 
-                GROUP BY role
-            """, (session_id,))
-            
-            message_counts = dict(cursor.fetchall())
-            
-            # Get first and last message timestamps
-            cursor.execute("""
-                SELECT MIN(timestamp), MAX(timestamp) 
-                FROM messages 
-                WHERE session_id = ?
-            """, (session_id,))
-            
-            first_msg, last_msg = cursor.fetchone()
-            
-            # Get tool usage count
+
+            # One round-trip instead of three: per-role counts and the
+            # timestamp bounds come from the GROUP BY, the tool count from
+            # a scalar subquery repeated on each (few) rows
             cursor.execute("""
-                SELECT COUNT(*) 
-                FROM tools_log 
+                SELECT
+                    role,
+                    COUNT(*) as count,
+                    MIN(timestamp),
+                    MAX(timestamp),
+                    (SELECT COUNT(*) FROM tools_log WHERE session_id = ?)
+                FROM messages
                 WHERE session_id = ?
-            """, (session_id,))
-            
-            tool_usage_count = cursor.fetchone()[0]
-        
+                GROUP BY role
+            """, (session_id, session_id))
+
+            rows = cursor.fetchall()
+
+            message_counts = {}
+            first_msg = last_msg = None
+            tool_usage_count = 0
+            for role, count, row_min, row_max, tool_count in rows:
+                message_counts[role] = count
+                if first_msg is None or row_min < first_msg:
+                    first_msg = row_min
+                if last_msg is None or row_max > last_msg:
+                    last_msg = row_max
+                tool_usage_count = tool_count
+
+            if not rows:
+                # No messages for this session; fetch the tool count alone
+                cursor.execute(
+                    "SELECT COUNT(*) FROM tools_log WHERE session_id = ?",
+                    (session_id,)
+                )
+                tool_usage_count = cursor.fetchone()[0]
+
         return {
             "session_id": session_id,
             "message_counts": message_counts,
@@ -124,17 +154,51 @@ class ChatInterface:
             # Show delete button
             if st.sidebar.button(f"Delete {selected_session}", key=f"delete_{selected_session}"):
                 self.chat_manager.delete_chat_session(selected_session)
+                self._drop_window(selected_session)
                 st.sidebar.success("Session deleted!")
-                st.experimental_rerun()
+                st.rerun()
             
             return selected_session
         
         return "default"
     
+    def _session_window(self, session_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get the rolling message window for a session from session state.
+
+        Each window is stored with the database write-version it reflects,
+        so pure UI reruns never touch SQLite while out-of-band writes
+        (chiefly proactive agents posting into the session through their
+        own manager) force a reload on the next rerun.
+        """
+        cache = st.session_state.setdefault("msg_cache", {})
+        version = self.chat_manager.db_manager.version
+        entry = cache.get(session_id)
+        if entry is None or entry[0] != version:
+            # Copy so later appends don't mutate ChatManager's cached list
+            entry = [version, list(self.chat_manager.load_chat_history(session_id, limit))]
+            cache[session_id] = entry
+        return entry[1]
+
+    def _append_to_window(self, session_id: str, role: str, content: str) -> None:
+        """Append a new turn to the session window if it is loaded.
+
+        The stored version is advanced to the post-save value so the
+        window's own writes don't trigger a redundant reload.
+        """
+        cache = st.session_state.get("msg_cache", {})
+        entry = cache.get(session_id)
+        if entry is not None:
+            entry[1].append({"role": role, "content": content})
+            entry[0] = self.chat_manager.db_manager.version
+
+    def _drop_window(self, session_id: str) -> None:
+        """Invalidate the cached window for a deleted/cleared session"""
+        st.session_state.get("msg_cache", {}).pop(session_id, None)
+
     def render_message_history(self, session_id: str = "default", limit: Optional[int] = None):
         """Render chat message history"""
-        messages = self.chat_manager.load_chat_history(session_id, limit)
-        
+        messages = self._session_window(session_id, limit)
+
         # Display messages
         for msg in messages:
             with st.chat_message(msg["role"]):
@@ -147,7 +211,8 @@ class ChatInterface:
         if user_input:
             # Save user message
             self.chat_manager.save_user_message(user_input, session_id)
-            
+            self._append_to_window(session_id, "user", user_input)
+
             # Display user message immediately
             with st.chat_message("user"):
                 st.markdown(user_input)
@@ -159,9 +224,23 @@ class ChatInterface:
         # Display response
         with st.chat_message("assistant"):
             st.markdown(response, unsafe_allow_html=True)
-        
+
         # Save response
         self.chat_manager.save_assistant_message(response, session_id)
+        self._append_to_window(session_id, "assistant", response)
+
+    def display_assistant_stream(self, stream, session_id: str = "default") -> str:
+        """Display a streaming assistant response as it arrives and save it"""
+        with st.chat_message("assistant"):
+            response = st.write_stream(stream)
+
+        # write_stream returns the accumulated text (or a list of parts)
+        if not isinstance(response, str):
+            response = "".join(str(part) for part in response)
+
+        self.chat_manager.save_assistant_message(response, session_id)
+        self._append_to_window(session_id, "assistant", response)
+        return response
     
     def render_session_manager(self):
         """Render session management interface"""
@@ -174,17 +253,23 @@ class ChatInterface:
                 new_session = self.chat_manager.create_new_session()
                 st.session_state.current_session = new_session
                 st.sidebar.success(f"Created {new_session}")
-                st.experimental_rerun()
+                st.rerun()
         
         with col2:
             if st.button("Clear Current", key="clear_current"):
                 current_session = getattr(st.session_state, 'current_session', 'default')
                 self.chat_manager.delete_chat_session(current_session)
+                self._drop_window(current_session)
                 st.sidebar.success("Session cleared!")
-                st.experimental_rerun()
+                st.rerun()
     
-    def render_chat_tab(self, agent_runner_callback=None):
-        """Render complete chat tab interface"""
+    def render_chat_tab(self, agent_runner_callback=None, agent_stream_callback=None):
+        """Render complete chat tab interface.
+
+        agent_stream_callback, when given, takes precedence and must return
+        an iterator of response chunks; agent_runner_callback returns the
+        full response at once.
+        """
         # Initialize session state
         if 'current_session' not in st.session_state:
             st.session_state.current_session = 'default'
@@ -212,21 +297,27 @@ class ChatInterface:
         if current_session == st.session_state.current_session:
             user_input = self.render_chat_input(current_session)
             
-            # Process user input if provided and callback is available
-            if user_input and agent_runner_callback:
+            # Process user input if provided and a callback is available
+            if user_input and (agent_stream_callback or agent_runner_callback):
                 try:
                     with st.spinner("Processing your request..."):
-                        # Get recent messages for context
-                        recent_messages = self.chat_manager.load_chat_history(current_session, limit=10)
-                        
-                        # Run agent
-                        response = agent_runner_callback(user_input, recent_messages)
-                        
-                        # Display response
-                        self.display_assistant_response(response, current_session)
-                        
+                        # Agent context comes from the in-memory window
+                        # (which already includes this user turn), not a
+                        # fresh DB read
+                        recent_messages = self._session_window(current_session, limit=50)[-10:]
+
+                        # Run agent, streaming tokens when supported
+                        if agent_stream_callback:
+                            self.display_assistant_stream(
+                                agent_stream_callback(user_input, recent_messages),
+                                current_session
+                            )
+                        else:
+                            response = agent_runner_callback(user_input, recent_messages)
+                            self.display_assistant_response(response, current_session)
+
                         # Rerun to show the new messages
-                        st.experimental_rerun()
+                        st.rerun()
                 
                 except Exception as e:
                     error_msg = f"❌ Error processing your request: {str(e)}"
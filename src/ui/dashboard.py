@@ -9,6 +9,71 @@ from datetime import datetime, timedelta
 from src.database.models import DatabaseManager
 
 
+# Query texts hoisted to module level with the window length bound as a
+# parameter: every render reuses one prepared plan per statement instead of
+# re-parsing a new query text for each distinct day count
+_TOOL_USAGE_SQL = """
+    SELECT tool_name, COUNT(*) as usage_count
+    FROM tools_log
+    WHERE timestamp >= date('now', ? || ' days')
+    GROUP BY tool_name
+    ORDER BY usage_count DESC
+"""
+
+_PROACTIVE_STATS_SQL = """
+    SELECT
+        DATE(timestamp) as date,
+        strftime('%H', timestamp) as hour,
+        tool_name,
+        COUNT(*) as executions
+    FROM tools_log
+    WHERE timestamp >= date('now', ? || ' days')
+      AND tool_name NOT IN ('system', 'user')
+    GROUP BY date, hour, tool_name
+    ORDER BY date, hour
+"""
+
+# Single scan with CASE classification instead of two UNIONed selects that
+# each walked the messages table independently
+_ALERTS_SQL = """
+    SELECT
+        content,
+        timestamp,
+        CASE
+            WHEN content LIKE '⚠️%' THEN 'alert'
+            WHEN content LIKE '🔔%' THEN 'proactive'
+        END as type
+    FROM messages
+    WHERE (content LIKE '⚠️%' OR content LIKE '🔔%')
+      AND timestamp >= date('now', ? || ' days')
+    ORDER BY timestamp DESC
+"""
+
+_MESSAGE_VOLUME_SQL = """
+    SELECT
+        DATE(timestamp) as date,
+        role,
+        COUNT(*) as message_count
+    FROM messages
+    WHERE timestamp >= date('now', ? || ' days')
+    GROUP BY date, role
+    ORDER BY date
+"""
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_frame(_loader, name: str, days: int, db_version: int):
+    """Cache a query result across Streamlit reruns.
+
+    Streamlit reruns the whole script per widget interaction, so identical
+    dashboard queries repeat constantly. Entries are keyed on the query
+    name, the selected window and the database write-version (plus a 30s
+    TTL for the relative date('now') windows); the loader itself is
+    excluded from hashing by the underscore prefix.
+    """
+    return _loader(days)
+
+
 class DashboardRenderer:
     """Dashboard renderer for SOC automation metrics"""
     
@@ -16,37 +81,24 @@ class DashboardRenderer:
         self.db_manager = db_manager or DatabaseManager()
     
     def get_tool_usage_data(self, days: int = 30) -> pd.DataFrame:
-        """Get tool usage statistics"""
-        with self.db_manager.get_connection() as conn:
-            query = """
-                SELECT tool_name, COUNT(*) as usage_count 
-                FROM tools_log 
-                WHERE timestamp >= date('now', '-{} days')
-                GROUP BY tool_name 
-                ORDER BY usage_count DESC
-            """.format(days)
-            
-            df = pd.read_sql(query, conn)
+        """Get tool usage statistics (cached across reruns)"""
+        return _cached_frame(self._query_tool_usage, "tool_usage", days, self.db_manager.version)
+
+    def _query_tool_usage(self, days: int = 30) -> pd.DataFrame:
+        """Query tool usage statistics from the database"""
+        with self.db_manager.get_read_connection() as conn:
+            df = pd.read_sql(_TOOL_USAGE_SQL, conn, params=[f"-{days}"])
         
         return df
     
     def get_proactive_execution_stats(self, days: int = 7) -> pd.DataFrame:
-        """Get proactive agent execution statistics"""
-        with self.db_manager.get_connection() as conn:
-            query = """
-                SELECT 
-                    DATE(timestamp) as date,
-                    strftime('%H', timestamp) as hour,
-                    tool_name,
-                    COUNT(*) as executions
-                FROM tools_log 
-                WHERE timestamp >= date('now', '-{} days')
-                  AND tool_name NOT IN ('system', 'user')
-                GROUP BY date, hour, tool_name
-                ORDER BY date, hour
-            """.format(days)
-            
-            df = pd.read_sql(query, conn)
+        """Get proactive agent execution statistics (cached across reruns)"""
+        return _cached_frame(self._query_proactive_stats, "proactive_stats", days, self.db_manager.version)
+
+    def _query_proactive_stats(self, days: int = 7) -> pd.DataFrame:
+        """Query proactive agent execution statistics from the database"""
+        with self.db_manager.get_read_connection() as conn:
+            df = pd.read_sql(_PROACTIVE_STATS_SQL, conn, params=[f"-{days}"])
         
         if not df.empty:
             df['datetime'] = pd.to_datetime(df['date'] + ' ' + df['hour'] + ':00:00')
@@ -54,22 +106,13 @@ class DashboardRenderer:
         return df
     
     def get_alerts_data(self, days: int = 7) -> pd.DataFrame:
-        """Get alert messages"""
-        with self.db_manager.get_connection() as conn:
-            query = """
-                SELECT content, timestamp, 'alert' as type
-                FROM messages 
-                WHERE content LIKE '⚠️%' 
-                  AND timestamp >= date('now', '-{} days')
-                UNION ALL
-                SELECT content, timestamp, 'proactive' as type
-                FROM messages 
-                WHERE content LIKE '🔔%' 
-                  AND timestamp >= date('now', '-{} days')
-                ORDER BY timestamp DESC
-            """.format(days)
-            
-            df = pd.read_sql(query, conn)
+        """Get alert messages (cached across reruns)"""
+        return _cached_frame(self._query_alerts, "alerts", days, self.db_manager.version)
+
+    def _query_alerts(self, days: int = 7) -> pd.DataFrame:
+        """Query alert messages from the database"""
+        with self.db_manager.get_read_connection() as conn:
+            df = pd.read_sql(_ALERTS_SQL, conn, params=[f"-{days}"])
         
         if not df.empty:
             df['timestamp'] = pd.to_datetime(df['timestamp'])
@@ -77,20 +120,13 @@ class DashboardRenderer:
         return df
     
     def get_message_volume_stats(self, days: int = 30) -> pd.DataFrame:
-        """Get message volume statistics"""
-        with self.db_manager.get_connection() as conn:
-            query = """
-                SELECT 
-                    DATE(timestamp) as date,
-                    role,
-                    COUNT(*) as message_count
-                FROM messages 
-                WHERE timestamp >= date('now', '-{} days')
-                GROUP BY date, role
-                ORDER BY date
-            """.format(days)
-            
-            df = pd.read_sql(query, conn)
+        """Get message volume statistics (cached across reruns)"""
+        return _cached_frame(self._query_message_volume, "message_volume", days, self.db_manager.version)
+
+    def _query_message_volume(self, days: int = 30) -> pd.DataFrame:
+        """Query message volume statistics from the database"""
+        with self.db_manager.get_read_connection() as conn:
+            df = pd.read_sql(_MESSAGE_VOLUME_SQL, conn, params=[f"-{days}"])
         
         if not df.empty:
             df['date'] = pd.to_datetime(df['date'])
@@ -98,39 +134,34 @@ class DashboardRenderer:
         return df
     
     def get_agent_performance_metrics(self) -> Dict[str, Any]:
-        """Get agent performance metrics"""
-        with self.db_manager.get_connection() as conn:
-            # Get total messages
+        """Get agent performance metrics (cached across reruns)"""
+        return _cached_frame(self._query_performance_metrics, "metrics", 0, self.db_manager.version)
+
+    def _query_performance_metrics(self, _days: int = 0) -> Dict[str, Any]:
+        """Query agent performance metrics from the database"""
+        with self.db_manager.get_read_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM messages")
-            total_messages = cursor.fetchone()[0]
-            
-            # Get total tool executions
-            cursor.execute("SELECT COUNT(*) FROM tools_log")
-            total_tool_executions = cursor.fetchone()[0]
-            
-            # Get active proactive agents
-            cursor.execute("SELECT COUNT(*) FROM proactive_agents WHERE enabled = 1")
-            active_agents = cursor.fetchone()[0]
-            
-            # Get recent activity (last 24 hours)
-            cursor.execute("""
-                SELECT COUNT(*) FROM messages 
-                WHERE timestamp >= datetime('now', '-1 day')
-            """)
-            recent_messages = cursor.fetchone()[0]
-            
-            # Get error rate (last 7 days)
+
+            # All five KPI values in a single round-trip via scalar
+            # subselects, instead of five serial cursor executes
             cursor.execute("""
-                SELECT 
-                    COUNT(CASE WHEN content LIKE '⚠️%' THEN 1 END) as errors,
-                    COUNT(*) as total
-                FROM messages 
-                WHERE timestamp >= date('now', '-7 days')
+                SELECT
+                    (SELECT COUNT(*) FROM messages),
+                    (SELECT COUNT(*) FROM tools_log),
+                    (SELECT COUNT(*) FROM proactive_agents WHERE enabled = 1),
+                    (SELECT COUNT(*) FROM messages
+                     WHERE timestamp >= datetime('now', '-1 day')),
+                    (SELECT COUNT(*) FROM messages
+                     WHERE content LIKE '⚠️%'
+                       AND timestamp >= date('now', '-7 days')),
+                    (SELECT COUNT(*) FROM messages
+                     WHERE timestamp >= date('now', '-7 days'))
             """)
-            error_stats = cursor.fetchone()
-            error_rate = (error_stats[0] / error_stats[1] * 100) if error_stats[1] > 0 else 0
-        
+            (total_messages, total_tool_executions, active_agents,
+             recent_messages, errors_7d, total_7d) = cursor.fetchone()
+
+            error_rate = (errors_7d / total_7d * 100) if total_7d > 0 else 0
+
         return {
             "total_messages": total_messages,
             "total_tool_executions": total_tool_executions,
@@ -212,20 +243,17 @@ class DashboardRenderer:
         df_alerts = self.get_alerts_data(days)
         
         if not df_alerts.empty:
-            # Format the content for better display
-            df_display = df_alerts.copy()
-            df_display['timestamp'] = df_display['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
-            df_display['content'] = df_display['content'].str[:100] + '...'  # Truncate long content
-            
-            # Add color coding
-            df_display['priority'] = df_display['type'].map({
-                'alert': '🚨 High',
-                'proactive': '🔔 Info'
-            })
-            
-            # Reorder columns
-            df_display = df_display[['timestamp', 'priority', 'content']]
-            
+            # One assign with vectorized column ops (C loops) instead of a
+            # full copy plus per-column Python mutation
+            df_display = df_alerts.assign(
+                timestamp=df_alerts['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S'),
+                content=df_alerts['content'].str.slice(0, 100) + '...',
+                priority=df_alerts['type'].map({
+                    'alert': '🚨 High',
+                    'proactive': '🔔 Info'
+                })
+            )[['timestamp', 'priority', 'content']]
+
             st.dataframe(df_display, use_container_width=True)
             
             # Show summary stats
@@ -3,6 +3,7 @@ Utility functions for SOC Agent Automation.
 """
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 import json
 import re
@@ -10,7 +11,11 @@ import re
 
 def timestamp() -> str:
     """Get current timestamp as string"""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Attribute access plus an f-string avoids strftime re-parsing the
+    # format string on every call, which adds up in logging loops
+    n = datetime.now()
+    return (f"{n.year:04d}-{n.month:02d}-{n.day:02d} "
+            f"{n.hour:02d}:{n.minute:02d}:{n.second:02d}")
 
 
 def iso_timestamp() -> str:
@@ -18,18 +23,38 @@ def iso_timestamp() -> str:
     return datetime.now().isoformat()
 
 
+@lru_cache(maxsize=4096)
 def format_datetime(dt_string: str, format_out: str = "%Y-%m-%d %H:%M:%S") -> str:
-    """Format datetime string to desired format"""
+    """Format datetime string to desired format.
+
+    Memoized: the same timestamps recur across log lines and dashboard
+    renders, so repeats become a hash lookup.
+    """
     try:
-        dt = datetime.fromisoformat(dt_string.replace('Z', '+00:00'))
+        # Slice the trailing Z instead of scanning the whole string with
+        # replace; only ISO inputs that actually end in Z pay for the copy
+        if dt_string.endswith('Z'):
+            dt = datetime.fromisoformat(dt_string[:-1] + '+00:00')
+        else:
+            dt = datetime.fromisoformat(dt_string)
+        if format_out == "%Y-%m-%d %H:%M:%S":
+            # Default output built from attributes directly, skipping
+            # strftime's per-call format parsing and locale machinery
+            return (f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+                    f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}")
         return dt.strftime(format_out)
     except ValueError:
         return dt_string
 
 
+# Invalid-character mapping built once; str.translate beats the regex
+# engine for a fixed single-character set on short filename strings
+_FILENAME_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename by removing invalid characters"""
-    return re.sub(r'[<>:"/\\|?*]', '_', filename)
+    return filename.translate(_FILENAME_TABLE)
 
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
@@ -39,18 +64,35 @@ def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     return text[:max_length - len(suffix)] + suffix
 
 
+# JSON codec chosen once at import: orjson (C implementation) when
+# installed, stdlib json otherwise. Both raise ValueError subclasses on bad
+# input, so the safe_* wrappers below catch the same way either way.
+try:
+    import orjson
+
+    def _json_dumps(data: Any) -> str:
+        return orjson.dumps(data, default=str).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data: Any) -> str:
+        return json.dumps(data, default=str)
+
+    _json_loads = json.loads
+
+
 def safe_json_loads(json_string: str, default: Any = None) -> Any:
     """Safely load JSON string with fallback"""
     try:
-        return json.loads(json_string)
-    except (json.JSONDecodeError, TypeError):
+        return _json_loads(json_string)
+    except (ValueError, TypeError):
         return default
 
 
 def safe_json_dumps(data: Any, default: str = "{}") -> str:
     """Safely dump data to JSON string with fallback"""
     try:
-        return json.dumps(data, default=str)
+        return _json_dumps(data)
     except (TypeError, ValueError):
         return default
 
@@ -85,79 +127,121 @@ def setup_logging(level: str = "INFO", format_string: Optional[str] = None) -> l
     return logging.getLogger(__name__)
 
 
+# Default sensitive-field patterns fused into one compiled alternation, so
+# the common call scans the text once instead of four times
+_SENSITIVE_RE = re.compile(
+    r'(?:password|api_key|token|secret)["\s]*[:=]["\s]*([^"\s,}]+)',
+    re.IGNORECASE
+)
+
+
+def _mask_match(m) -> str:
+    """Replace the captured value of a sensitive-field match with stars"""
+    return m.group(0).replace(m.group(1), '*' * len(m.group(1)))
+
+
 def mask_sensitive_data(text: str, patterns: Optional[List[str]] = None) -> str:
     """Mask sensitive data in text using regex patterns"""
     if patterns is None:
-        patterns = [
-            r'password["\s]*[:=]["\s]*([^"\s,}]+)',  # password fields
-            r'api_key["\s]*[:=]["\s]*([^"\s,}]+)',   # API keys
-            r'token["\s]*[:=]["\s]*([^"\s,}]+)',     # tokens
-            r'secret["\s]*[:=]["\s]*([^"\s,}]+)',    # secrets
-        ]
-    
+        return _SENSITIVE_RE.sub(_mask_match, text)
+
     masked_text = text
     for pattern in patterns:
-        masked_text = re.sub(pattern, lambda m: m.group(0).replace(m.group(1), '*' * len(m.group(1))), 
-                           masked_text, flags=re.IGNORECASE)
-    
+        masked_text = re.sub(pattern, _mask_match, masked_text, flags=re.IGNORECASE)
+
     return masked_text
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+@lru_cache(maxsize=1024)
 def format_file_size(size_bytes: int) -> str:
-    """Format file size in human readable format"""
+    """Format file size in human readable format (memoized)"""
     if size_bytes == 0:
         return "0 B"
-    
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
-    
-    return f"{size_bytes:.2f} {size_names[i]}"
+
+    if isinstance(size_bytes, int):
+        # Size class straight from the bit length: one integer op instead
+        # of a division loop
+        i = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    else:
+        i = 0
+        while size_bytes >= 1024 and i < len(_SIZE_UNITS) - 1:
+            size_bytes /= 1024.0
+            i += 1
+        return f"{size_bytes:.2f} {_SIZE_UNITS[i]}"
+
+    return f"{size_bytes / (1 << (i * 10)):.2f} {_SIZE_UNITS[i]}"
 
 
-def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
-    """Split list into chunks of specified size"""
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+def chunk_list(lst: List[Any], chunk_size: int):
+    """Split list into chunks of specified size.
+
+    Yields chunks lazily so large inputs (e.g. bulk insert batches) never
+    materialize a second full-size list-of-lists; wrap in list() if all
+    chunks are needed at once.
+    """
+    for i in range(0, len(lst), chunk_size):
+        yield lst[i:i + chunk_size]
 
 
 def flatten_dict(d: Dict[str, Any], parent_key: str = '', sep: str = '.') -> Dict[str, Any]:
     """Flatten nested dictionary"""
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, new_key, sep=sep).items())
-        else:
-            items.append((new_key, v))
-    return dict(items)
+    # Iterative DFS writing straight into one output dict: no recursion
+    # frames and no intermediate per-level dicts
+    out = {}
+    stack = [(parent_key, d)]
+    while stack:
+        prefix, current = stack.pop()
+        for k, v in current.items():
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+            if isinstance(v, dict):
+                stack.append((new_key, v))
+            else:
+                out[new_key] = v
+    return out
 
 
 def deep_merge_dicts(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, Any]:
-    """Deep merge two dictionaries"""
-    result = dict1.copy()
-    
-    for key, value in dict2.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge_dicts(result[key], value)
-        else:
-            result[key] = value
-    
+    """Deep merge two dictionaries.
+
+    Only dicts that both sides define are copied; untouched nested dicts
+    are shared with the inputs rather than re-copied at every level.
+    """
+    result = {**dict1}
+    stack = [(result, dict2)]
+
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            existing = dst.get(key)
+            if isinstance(existing, dict) and isinstance(value, dict):
+                dst[key] = {**existing}
+                stack.append((dst[key], value))
+            else:
+                dst[key] = value
+
     return result
 
 
-def retry_with_backoff(func, max_retries: int = 3, backoff_factor: float = 1.0, 
-                      exceptions: tuple = (Exception,)):
-    """Decorator for retrying function calls with exponential backoff"""
+def retry_with_backoff(max_retries: int = 3, backoff_factor: float = 1.0,
+                       exceptions: tuple = (Exception,)):
+    """Decorator factory for retrying function calls with exponential backoff.
+
+    Waits grow as backoff_factor * 2**attempt plus a random jitter slice,
+    so simultaneous retriers (e.g. parallel health checks) don't stampede
+    the failing dependency in lockstep.
+    """
     import time
+    import random
     import functools
-    
+
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             last_exception = None
-            
+
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
@@ -165,14 +249,49 @@ def retry_with_backoff(func, max_retries: int = 3, backoff_factor: float = 1.0,
                     last_exception = e
                     if attempt == max_retries:
                         break
-                    
-                    wait_time = backoff_factor * (2 ** attempt)
+
+                    wait_time = backoff_factor * (2 ** attempt) + random.uniform(0, backoff_factor)
                     time.sleep(wait_time)
-            
+
             raise last_exception
-        
+
         return wrapper
-    
+
+    return decorator
+
+
+def ttl_cache(ttl_seconds: float = 30.0, maxsize: int = 128):
+    """Decorator caching function results with a time-to-live.
+
+    Intended for API lookups (e.g. Wazuh queries) whose results only change
+    on the minute scale; repeated calls within the TTL become dict lookups.
+    The wrapped function gains a cache_clear() for explicit invalidation
+    after mutating operations.
+    """
+    import time
+    import functools
+
+    def decorator(func):
+        cache = {}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = cache.get(key)
+            if hit is not None and now < hit[1]:
+                return hit[0]
+
+            value = func(*args, **kwargs)
+            if len(cache) >= maxsize:
+                # Drop the oldest entry to bound memory
+                cache.pop(next(iter(cache)))
+            cache[key] = (value, now + ttl_seconds)
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
     return decorator
 
 
@@ -187,24 +306,36 @@ class HealthChecker:
         self.checks[name] = check_func
     
     def run_checks(self) -> Dict[str, Dict[str, Any]]:
-        """Run all health checks"""
+        """Run all health checks concurrently"""
+        from concurrent.futures import ThreadPoolExecutor
+
         results = {}
-        
-        for name, check_func in self.checks.items():
-            try:
-                result = check_func()
-                results[name] = {
-                    "status": "healthy" if result else "unhealthy",
-                    "result": result,
-                    "timestamp": iso_timestamp()
-                }
-            except Exception as e:
-                results[name] = {
-                    "status": "error",
-                    "error": extract_error_message(e),
-                    "timestamp": iso_timestamp()
-                }
-        
+        if not self.checks:
+            return results
+
+        # Checks are mostly blocking I/O (DB pings, HTTP probes), so total
+        # latency drops from the sum of checks to roughly the slowest one
+        with ThreadPoolExecutor(max_workers=min(8, len(self.checks))) as executor:
+            futures = {
+                name: executor.submit(check_func)
+                for name, check_func in self.checks.items()
+            }
+
+            for name, future in futures.items():
+                try:
+                    result = future.result()
+                    results[name] = {
+                        "status": "healthy" if result else "unhealthy",
+                        "result": result,
+                        "timestamp": iso_timestamp()
+                    }
+                except Exception as e:
+                    results[name] = {
+                        "status": "error",
+                        "error": extract_error_message(e),
+                        "timestamp": iso_timestamp()
+                    }
+
         return results
     
     def get_overall_health(self) -> bool:
@@ -225,4 +356,6 @@ def get_health_checker() -> HealthChecker:
 # Legacy function
 def timestamp():
     """Legacy timestamp function"""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
\ No newline at end of file
+    n = datetime.now()
+    return (f"{n.year:04d}-{n.month:02d}-{n.day:02d} "
+            f"{n.hour:02d}:{n.minute:02d}:{n.second:02d}")
\ No newline at end of file
@@ -2,8 +2,6 @@
 Test configuration and fixtures for SOC Agent Automation tests.
 """
 import pytest
-import tempfile
-import os
 from unittest.mock import Mock
 
 from config.settings import TestConfig
@@ -12,19 +10,18 @@ from src.database.models import DatabaseManager
 
 @pytest.fixture
 def temp_db():
-    """Create a temporary database for testing"""
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as tmp_file:
-        temp_db_path = tmp_file.name
-    
-    # Create database manager with temp DB
-    db_manager = DatabaseManager(temp_db_path)
+    """Create a fresh in-memory database for testing.
+
+    In-memory databases skip the tempfile create/fsync/unlink cycle the
+    old fixture paid per test while keeping full per-test isolation: each
+    test gets its own private database that vanishes with the connection.
+    """
+    db_manager = DatabaseManager(":memory:")
     db_manager.init_db()
-    
+
     yield db_manager
-    
-    # Cleanup
-    if os.path.exists(temp_db_path):
-        os.unlink(temp_db_path)
+
+    db_manager.close()
 
 
 @pytest.fixture
@@ -27,16 +27,18 @@ def test_mcp_config_generation():
     assert "env" in mcp_config["mcpServers"]["wazuh"]
 
 
-@patch.dict(os.environ, {
-    'GROQ_API_KEY': 'test_key',
-    'MCP_COMMAND': 'test_command',
-    'WAZUH_API_PASSWORD': 'test_password',
-    'WAZUH_INDEXER_PASSWORD': 'test_password'
-})
 def test_config_validation():
     """Test configuration validation"""
-    config = Config()
-    assert config.validate_config() is True
+    with patch.dict(os.environ, {
+        'GROQ_API_KEY': 'test_key',
+        'MCP_COMMAND': 'test_command',
+        'WAZUH_API_PASSWORD': 'test_password',
+        'WAZUH_INDEXER_PASSWORD': 'test_password'
+    }):
+        Config.refresh_env()
+        config = Config()
+        assert config.validate_config() is True
+    Config.refresh_env()
 
 
 def test_config_validation_failure():
@@ -65,11 +67,21 @@ def test_test_config():
     assert config.DATABASE_FILE == ":memory:"
 
 
-@patch.dict(os.environ, {'FLASK_ENV': 'production'})
 def test_get_config():
     """Test getting configuration based on environment"""
-    config = get_config()
-    assert isinstance(config, ProductionConfig)
-    
+    with patch.dict(os.environ, {'FLASK_ENV': 'production'}):
+        Config.refresh_env()
+        config = get_config()
+        assert isinstance(config, ProductionConfig)
+    Config.refresh_env()
+
     config_dev = get_config('development')
-    assert isinstance(config_dev, DevelopmentConfig)
\ No newline at end of file
+    assert isinstance(config_dev, DevelopmentConfig)
+
+def test_compile_config():
+    """Test compiling configuration into a constants module"""
+    from config.settings import compile_config
+
+    module = compile_config()
+    assert module.GROQ_MODEL == Config.GROQ_MODEL
+    assert module.MAX_AGENT_STEPS == Config.MAX_AGENT_STEPS
@@ -89,4 +89,61 @@ def test_proactive_agents(temp_db):
     
     # Check agent was deleted
     remaining_agents = temp_db.get_proactive_agents()
-    assert len(remaining_agents) == 0
\ No newline at end of file
+    assert len(remaining_agents) == 0
+
+def test_count_and_recent_messages(temp_db):
+    """Test message counting and bounded recent message retrieval"""
+    for i in range(7):
+        role = "user" if i % 2 == 0 else "assistant"
+        temp_db.save_message(role, f"Message {i}")
+    
+    assert temp_db.count_messages() == 7
+    
+    # Recent messages are limited and returned in chronological order
+    recent = temp_db.get_recent_messages(5)
+    assert len(recent) == 5
+    assert recent[0] == ("user", "Message 2")
+    assert recent[-1] == ("user", "Message 6")
+
+
+def test_bulk_saves(temp_db):
+    """Test bulk message and tool log persistence"""
+    inserted = temp_db.save_messages_bulk([
+        ("user", "Bulk message 1", "bulk_session"),
+        ("assistant", "Bulk message 2", "bulk_session"),
+    ])
+    assert inserted == 2
+
+    messages = temp_db.get_all_messages("bulk_session")
+    assert len(messages) == 2
+    assert messages[1]["content"] == "Bulk message 2"
+
+    inserted = temp_db.save_tool_logs_bulk([
+        ("bulk_tool", "Bulk usage", "bulk_session"),
+    ])
+    assert inserted == 1
+
+    logs = temp_db.get_all_tool_logs("bulk_session")
+    assert len(logs) == 1
+    assert logs[0]["tool_name"] == "bulk_tool"
+
+
+def test_save_proactive_events_batch(temp_db):
+    """Test batched persistence of proactive job outcomes"""
+    temp_db.save_proactive_agent("batch_agent", "Batch prompt", 15)
+    
+    temp_db.save_proactive_events([
+        ("batch_agent", "Update one", "Prompt executed: Batch prompt"),
+        ("batch_agent", "Update two", "Prompt executed: Batch prompt"),
+    ])
+    
+    messages = temp_db.get_all_messages()
+    assert len(messages) == 2
+    assert messages[0]["role"] == "assistant"
+    
+    logs = temp_db.get_all_tool_logs()
+    assert len(logs) == 2
+    assert logs[0]["tool_name"] == "batch_agent"
+    
+    agents = temp_db.get_proactive_agents()
+    assert agents[0]["last_run"] is not None